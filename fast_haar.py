@@ -0,0 +1,140 @@
+import cv2
+
+# --- CONFIGURATION ---
+SCALE_FACTOR = 1.1          # Same pyramid step as the plain detectMultiScale call
+MIN_NEIGHBORS = 5
+MIN_SIZE = (30, 30)         # Smallest face we care about (full-resolution pixels)
+ROI_PADDING = 0.6           # Search this fraction of the face size around each known face
+SIZE_MARGIN = 0.35          # Allowed face size change between frames (0.35 = +/-35%)
+FULL_SCAN_INTERVAL = 15     # Force a full-frame scan every N frames to pick up new people
+
+
+class FastHaarDetector:
+    """
+    Drop-in replacement for face_cascade.detectMultiScale(gray, 1.1, 5, minSize=(30, 30)).
+
+    - Searches a padded box around faces found in the previous frame first.
+    - Limits the scale pyramid to sizes close to the faces we recently saw.
+    - Falls back to a full-frame scan when the ROIs come up empty (or every FULL_SCAN_INTERVAL frames).
+    - Reuses the grayscale / downscaled buffers instead of allocating new ones each frame.
+
+    Returns boxes in the coordinates of the original frame, like detectMultiScale.
+    """
+
+    def __init__(self, cascade=None, scale_factor=SCALE_FACTOR, min_neighbors=MIN_NEIGHBORS,
+                 min_size=MIN_SIZE, downscale=1.0, roi_padding=ROI_PADDING,
+                 size_margin=SIZE_MARGIN, full_scan_interval=FULL_SCAN_INTERVAL):
+        if cascade is None:
+            cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+        if not 0 < downscale <= 1.0:
+            raise ValueError("downscale must be in (0, 1]")
+
+        self.cascade = cascade
+        self.scale_factor = scale_factor
+        self.min_neighbors = min_neighbors
+        self.min_size = min_size
+        self.downscale = downscale
+        self.roi_padding = roi_padding
+        self.size_margin = size_margin
+        self.full_scan_interval = full_scan_interval
+
+        # Reusable buffers (allocated on the first frame, re-allocated only if the frame size changes)
+        self._gray = None
+        self._small = None
+
+        # Tracking state, in downscaled coordinates
+        self._known_faces = []
+        self._frames_since_full = 0
+
+    def reset(self):
+        self._known_faces = []
+        self._frames_since_full = 0
+
+    def _prepare(self, frame):
+        h, w = frame.shape[:2]
+
+        if frame.ndim == 2:
+            gray = frame
+        else:
+            if self._gray is None or self._gray.shape != (h, w):
+                self._gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            else:
+                cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+            gray = self._gray
+
+        if self.downscale == 1.0:
+            return gray
+
+        small_w = max(1, int(w * self.downscale))
+        small_h = max(1, int(h * self.downscale))
+        if self._small is None or self._small.shape != (small_h, small_w):
+            self._small = cv2.resize(gray, (small_w, small_h), interpolation=cv2.INTER_AREA)
+        else:
+            cv2.resize(gray, (small_w, small_h), dst=self._small, interpolation=cv2.INTER_AREA)
+        return self._small
+
+    def _scaled_min_size(self):
+        return (max(1, int(self.min_size[0] * self.downscale)),
+                max(1, int(self.min_size[1] * self.downscale)))
+
+    def _full_scan(self, image):
+        faces = self.cascade.detectMultiScale(image, self.scale_factor, self.min_neighbors,
+                                              minSize=self._scaled_min_size())
+        return [tuple(int(v) for v in f) for f in faces]
+
+    def _roi_scan(self, image):
+        h_img, w_img = image.shape[:2]
+        min_w, min_h = self._scaled_min_size()
+        found = []
+
+        for (x, y, w, h) in self._known_faces:
+            # Only look for faces roughly the size of the one we saw last frame
+            lo = max(min_w, min_h, int(min(w, h) * (1 - self.size_margin)))
+            hi = max(lo + 1, int(max(w, h) * (1 + self.size_margin)))
+
+            # Padded search box around the last known position
+            pad_x = int(w * self.roi_padding)
+            pad_y = int(h * self.roi_padding)
+            x1 = max(0, x - pad_x)
+            y1 = max(0, y - pad_y)
+            x2 = min(w_img, x + w + pad_x)
+            y2 = min(h_img, y + h + pad_y)
+            if x2 - x1 < lo or y2 - y1 < lo:
+                continue
+
+            # Slicing gives a view, no copy
+            roi = image[y1:y2, x1:x2]
+            faces = self.cascade.detectMultiScale(roi, self.scale_factor, self.min_neighbors,
+                                                  minSize=(lo, lo), maxSize=(hi, hi))
+            for (fx, fy, fw, fh) in faces:
+                box = (int(fx) + x1, int(fy) + y1, int(fw), int(fh))
+                if not any(_overlaps(box, other) for other in found):
+                    found.append(box)
+
+        return found
+
+    def detect(self, frame):
+        image = self._prepare(frame)
+        self._frames_since_full += 1
+
+        faces = []
+        if self._known_faces and self._frames_since_full < self.full_scan_interval:
+            faces = self._roi_scan(image)
+
+        if not faces:
+            # Nothing around the known faces (or time for a periodic check) -> scan everything
+            faces = self._full_scan(image)
+            self._frames_since_full = 0
+
+        self._known_faces = faces
+
+        if self.downscale == 1.0:
+            return faces
+        inv = 1.0 / self.downscale
+        return [(int(x * inv), int(y * inv), int(w * inv), int(h * inv)) for (x, y, w, h) in faces]
+
+
+def _overlaps(a, b):
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
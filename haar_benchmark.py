@@ -0,0 +1,73 @@
+import argparse
+import time
+import cv2
+from fast_haar import FastHaarDetector
+
+# Compares frames/sec of the plain full-frame Haar call (test_video_capture.py)
+# against FastHaarDetector on recorded clips.
+#
+# Usage: python haar_benchmark.py clip1.mp4 clip2.mp4 [--max-frames 500] [--downscale 0.5]
+
+CASCADE_PATH = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+
+
+def load_frames(path, max_frames):
+    # Decode up front so video decoding doesn't count against either detector
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while len(frames) < max_frames:
+        ret, frame = cap.read()
+        if not ret: break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+
+def run_baseline(frames, cascade):
+    detections = 0
+    start = time.perf_counter()
+    for frame in frames:
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        faces = cascade.detectMultiScale(gray, 1.1, 5, minSize=(30, 30))
+        detections += len(faces)
+    elapsed = time.perf_counter() - start
+    return len(frames) / elapsed, detections
+
+
+def run_fast(frames, cascade, downscale):
+    detector = FastHaarDetector(cascade, downscale=downscale)
+    detections = 0
+    start = time.perf_counter()
+    for frame in frames:
+        faces = detector.detect(frame)
+        detections += len(faces)
+    elapsed = time.perf_counter() - start
+    return len(frames) / elapsed, detections
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark full-frame Haar vs FastHaarDetector")
+    parser.add_argument("clips", nargs="+", help="Recorded video files")
+    parser.add_argument("--max-frames", type=int, default=500)
+    parser.add_argument("--downscale", type=float, default=1.0,
+                        help="Extra downscale for the fast path (1.0 = same resolution as baseline)")
+    args = parser.parse_args()
+
+    cascade = cv2.CascadeClassifier(CASCADE_PATH)
+
+    print(f"{'clip':<30} {'frames':>7} {'base fps':>9} {'fast fps':>9} {'speedup':>8} {'base det':>9} {'fast det':>9}")
+    for path in args.clips:
+        frames = load_frames(path, args.max_frames)
+        if not frames:
+            print(f"{path:<30} could not read any frames, skipping")
+            continue
+
+        base_fps, base_det = run_baseline(frames, cascade)
+        fast_fps, fast_det = run_fast(frames, cascade, args.downscale)
+
+        print(f"{path[-30:]:<30} {len(frames):>7} {base_fps:>9.1f} {fast_fps:>9.1f} "
+              f"{fast_fps / base_fps:>7.2f}x {base_det:>9} {fast_det:>9}")
+
+
+if __name__ == "__main__":
+    main()
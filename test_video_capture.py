@@ -3,17 +3,20 @@ import time
 import os
 import math
 from datetime import datetime
+from fast_haar import FastHaarDetector
 
 # --- CONFIGURATION ---
 SAVE_FOLDER = "captured_faces"
 REQUIRED_STILL_TIME = 3.5   # Seconds of stillness required
 MOVEMENT_THRESHOLD = 50     # How many pixels they can drift before we reset the timer (Higher = More lenient)
+USE_FAST_HAAR = True        # ROI + limited scale search (see fast_haar.py). False = full-frame scan every frame
 
 if not os.path.exists(SAVE_FOLDER):
     os.makedirs(SAVE_FOLDER)
 
 video_capture = cv2.VideoCapture(0)
 face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+fast_detector = FastHaarDetector(face_cascade)
 
 # --- STATE VARIABLES ---
 anchor_center = None        # The (x,y) point where they started standing still
@@ -32,8 +35,11 @@ while True:
     ret, frame = video_capture.read()
     if not ret: break
 
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    faces = face_cascade.detectMultiScale(gray, 1.1, 5, minSize=(30, 30))
+    if USE_FAST_HAAR:
+        faces = fast_detector.detect(frame)
+    else:
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        faces = face_cascade.detectMultiScale(gray, 1.1, 5, minSize=(30, 30))
 
     # --- LOGIC 1: NO FACE DETECTED ---
     if len(faces) == 0: